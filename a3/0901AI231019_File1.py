@@ -53,9 +53,116 @@ NODE_POSITIONS = {
 }
 
 NODE_RADIUS = 42
+ARROW_COS = 16 * math.cos(0.4)
+ARROW_SIN = 16 * math.sin(0.4)
+
+
+def build_csr(graph):
+    """Map node names to contiguous ids and pack the adjacency into CSR lists."""
+    id_to_name = tuple(graph)
+    name_to_id = {name: i for i, name in enumerate(id_to_name)}
+    indptr = [0]
+    indices = []
+    for name in id_to_name:
+        indices.extend(name_to_id[neighbor] for neighbor in graph[name])
+        indptr.append(len(indices))
+    return name_to_id, id_to_name, indptr, indices
+
+
+def build_predecessors(neighbors):
+    """Invert per-id out-neighbor tuples into per-id in-neighbor tuples."""
+    preds = [[] for _ in neighbors]
+    for u, targets in enumerate(neighbors):
+        for v in targets:
+            preds[v].append(u)
+    return tuple(tuple(p) for p in preds)
+
+
+NAME_TO_ID, ID_TO_NAME, INDPTR, INDICES = build_csr(GRAPH)
+
+# Neighbor tuples per node id, sliced from the CSR lists once
+NEIGHBORS = tuple(
+    tuple(INDICES[INDPTR[u] : INDPTR[u + 1]]) for u in range(len(ID_TO_NAME))
+)
+NEIGHBORS_REV = tuple(neighbors[::-1] for neighbors in NEIGHBORS)
+# In-neighbors per node id, for searches that walk edges backwards
+PREDECESSORS = build_predecessors(NEIGHBORS)
+POS = tuple(NODE_POSITIONS[name] for name in ID_TO_NAME)
+
+
+def bfs_bidirectional(src, dst, succ=NEIGHBORS, pred=PREDECESSORS):
+    """Return a shortest src -> dst path of node ids, or None.
+
+    succ and pred hold each node's out- and in-neighbors, indexed by id.
+    """
+    if src == dst:
+        return [src]
+
+    parents_fwd = {src: None}
+    parents_bwd = {dst: None}
+    frontier_fwd = [src]
+    frontier_bwd = [dst]
+
+    def walk(parents, node):
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        return path
+
+    while frontier_fwd and frontier_bwd:
+        # Expand one full layer of the smaller side; the backward search
+        # walks edges in reverse
+        if len(frontier_fwd) <= len(frontier_bwd):
+            adj, seen, other, frontier = succ, parents_fwd, parents_bwd, frontier_fwd
+        else:
+            adj, seen, other, frontier = pred, parents_bwd, parents_fwd, frontier_bwd
+
+        next_frontier = []
+        meets = []
+        for node in frontier:
+            for neighbor in adj[node]:
+                if neighbor not in seen:
+                    seen[neighbor] = node
+                    next_frontier.append(neighbor)
+                    if neighbor in other:
+                        meets.append(neighbor)
+
+        if meets:
+            # Meeting nodes in one layer can sit at different depths on the
+            # other side, so keep the shortest joined path
+            paths = [
+                walk(parents_fwd, m)[::-1] + walk(parents_bwd, m)[1:] for m in meets
+            ]
+            return min(paths, key=len)
+
+        if frontier is frontier_fwd:
+            frontier_fwd = next_frontier
+        else:
+            frontier_bwd = next_frontier
+    return None
+
+
+def arrow_geometry(start_pos, end_pos):
+    """Return the line endpoints and arrowhead polygon for an edge."""
+    dx = end_pos[0] - start_pos[0]
+    dy = end_pos[1] - start_pos[1]
+    length = math.hypot(dx, dy)
+    ux, uy = dx / length, dy / length
+    tip_x = end_pos[0] - (NODE_RADIUS + 2) * ux
+    tip_y = end_pos[1] - (NODE_RADIUS + 2) * uy
+
+    # Arrowhead sides: the back direction (-ux, -uy) rotated by +/-0.4 rad
+    back_x = -ARROW_COS * ux
+    back_y = -ARROW_COS * uy
+    p1 = (tip_x + back_x + ARROW_SIN * uy, tip_y + back_y - ARROW_SIN * ux)
+    p2 = (tip_x + back_x - ARROW_SIN * uy, tip_y + back_y + ARROW_SIN * ux)
+    return start_pos, end_pos, [(tip_x, tip_y), p1, p2]
 
 
 class UIComponent:
+    __slots__ = ("rect", "hovered")
+
     def __init__(self, rect):
         self.rect = pygame.Rect(rect)
         self.hovered = False
@@ -66,6 +173,8 @@ class UIComponent:
 
 
 class Button(UIComponent):
+    __slots__ = ("text", "color", "hover_color", "action_id", "font")
+
     def __init__(self, rect, text, color, hover_color, action_id):
         super().__init__(rect)
         self.text = text
@@ -84,6 +193,8 @@ class Button(UIComponent):
 
 
 class RadioButton(UIComponent):
+    __slots__ = ("label", "node_id", "group", "selected", "font")
+
     def __init__(self, x, y, label, node_id, group):
         super().__init__((x, y, 110, 40))
         self.label = label
@@ -104,6 +215,8 @@ class RadioButton(UIComponent):
 
 
 class Slider(UIComponent):
+    __slots__ = ("min_val", "max_val", "value", "handle_rect", "dragging")
+
     def __init__(self, rect, min_val, max_val, initial_val):
         super().__init__(rect)
         self.min_val = min_val
@@ -129,17 +242,20 @@ class Slider(UIComponent):
         pygame.draw.circle(screen, COLOR_ACCENT, self.handle_rect.center, 11, 2)
 
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type == pygame.MOUSEMOTION:
+            if not self.dragging:
+                return
+            rx, rw = self.rect.x, self.rect.width
+            rel_x = max(0, min(event.pos[0] - rx, rw))
+            ratio = rel_x / rw
+            self.value = self.min_val + ratio * (self.max_val - self.min_val)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.handle_rect.collidepoint(event.pos) or self.rect.collidepoint(
                 event.pos
             ):
                 self.dragging = True
         elif event.type == pygame.MOUSEBUTTONUP:
             self.dragging = False
-        elif event.type == pygame.MOUSEMOTION and self.dragging:
-            rel_x = max(0, min(event.pos[0] - self.rect.x, self.rect.width))
-            ratio = rel_x / self.rect.width
-            self.value = self.min_val + ratio * (self.max_val - self.min_val)
 
 
 class GraphVisualizer:
@@ -151,18 +267,49 @@ class GraphVisualizer:
         self.font_title = pygame.font.SysFont("Arial", 32, bold=True)
         self.font_ui = pygame.font.SysFont("Arial", 20)
 
+        self.node_label_surfs = [
+            self.font_main.render(name, True, COLOR_TEXT).convert_alpha()
+            for name in ID_TO_NAME
+        ]
+        font_step = pygame.font.SysFont("Arial", 16, bold=True)
+        self.step_num_surfs = [
+            font_step.render(str(i), True, (255, 255, 255)).convert_alpha()
+            for i in range(1, len(GRAPH) + 1)
+        ]
+        self.edge_geom = [
+            arrow_geometry(NODE_POSITIONS[node], NODE_POSITIONS[neighbor])
+            for node, neighbors in GRAPH.items()
+            for neighbor in neighbors
+        ]
+        self.bg_surf = self.build_background()
+
+        # Only these regions change between frames: a box around each node
+        # (circle plus step badge) and the control panel below the divider
+        self.dirty_rects = [
+            pygame.Rect(pos[0] - 45, pos[1] - 45, 90, 90) for pos in POS
+        ]
+        self.dirty_rects.append(pygame.Rect(0, 682, WINDOW_WIDTH, WINDOW_HEIGHT - 682))
+        self._full_redraw = True
+
+        # Reused by every run instead of allocating a fresh frontier each time
+        self._bfs_queue = deque()
+        self._dfs_stack = []
+
+        self._needs_redraw = True
+        self.start_node = "A"
+
         self.reset_state()
         self.setup_ui()
 
     def reset_state(self):
-        self.visited = set()
         self.order = []
+        self.order_index = [None] * len(ID_TO_NAME)
         self.active_structure = []
+        self.active_set = set()
         self.current_node = None
         self.traversal_gen = None
         self.last_step_time = 0
         self.is_bfs = True
-        self.start_node = "A"
         self.status = "System Ready. Select start node and algorithm."
         self.animation_finished = False
 
@@ -185,88 +332,88 @@ class GraphVisualizer:
                 node,
                 self.radio_group,
             )
-            if node == "A":
+            if node == self.start_node:
                 rb.selected = True
             self.radio_group.append(rb)
 
         self.speed_slider = Slider((750, 815, 300, 10), 0.5, 5.0, 1.0)
+        self.clickables = self.buttons + self.radio_group
 
     def get_bfs_gen(self, start):
-        visited = set()
-        queue = deque([start])
-        visited.add(start)
-        yield ("init", None, visited, list(queue))
+        visited = bytearray((len(ID_TO_NAME) + 7) // 8)
+        source = NAME_TO_ID[start]
+        queue = self._bfs_queue
+        queue.clear()
+        queue.append(source)
+        visited[source >> 3] |= 1 << (source & 7)
+        yield ("init", source)
 
         while queue:
-            node = queue.popleft()
-            self.order.append(node)
-            yield ("visit", node, visited, list(queue))
+            u = queue.popleft()
+            yield ("visit", u)
 
-            for neighbor in GRAPH[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    yield ("queue", neighbor, visited, list(queue))
-        yield ("done", None, visited, [])
+            for v in NEIGHBORS[u]:
+                if not visited[v >> 3] & (1 << (v & 7)):
+                    visited[v >> 3] |= 1 << (v & 7)
+                    queue.append(v)
+                    yield ("queue", v)
+        yield ("done", None)
 
     def get_dfs_gen(self, start):
-        visited = set()
-        stack = [start]
-        yield ("init", None, visited, list(stack))
+        visited = bytearray((len(ID_TO_NAME) + 7) // 8)
+        stack = self._dfs_stack
+        stack.clear()
+        source = NAME_TO_ID[start]
+        stack.append(source)
+        yield ("init", source)
 
         while stack:
-            node = stack.pop()
-            if node not in visited:
-                visited.add(node)
-                self.order.append(node)
-                yield ("visit", node, visited, list(stack))
-
-                for neighbor in reversed(GRAPH[node]):
-                    if neighbor not in visited:
-                        stack.append(neighbor)
-                        yield ("stack", neighbor, visited, list(stack))
-        yield ("done", None, visited, [])
-
-    def draw_arrow(self, start_pos, end_pos, color):
-        pygame.draw.line(self.screen, color, start_pos, end_pos, 3)
-        angle = math.atan2(start_pos[1] - end_pos[1], start_pos[0] - end_pos[0])
-        dist = 16
-        offset_angle = math.atan2(end_pos[1] - start_pos[1], end_pos[0] - start_pos[0])
-        tip_x = end_pos[0] - (NODE_RADIUS + 2) * math.cos(offset_angle)
-        tip_y = end_pos[1] - (NODE_RADIUS + 2) * math.sin(offset_angle)
-
-        p1 = (
-            tip_x + dist * math.cos(angle + 0.4),
-            tip_y + dist * math.sin(angle + 0.4),
-        )
-        p2 = (
-            tip_x + dist * math.cos(angle - 0.4),
-            tip_y + dist * math.sin(angle - 0.4),
-        )
-        pygame.draw.polygon(self.screen, color, [(tip_x, tip_y), p1, p2])
-
-    def draw(self):
-        self.screen.fill(COLOR_BG)
+            u = stack.pop()
+            if not visited[u >> 3] & (1 << (u & 7)):
+                visited[u >> 3] |= 1 << (u & 7)
+                yield ("visit", u)
+
+                for v in NEIGHBORS_REV[u]:
+                    if not visited[v >> 3] & (1 << (v & 7)):
+                        stack.append(v)
+                        yield ("stack", v)
+        yield ("done", None)
+
+    def build_background(self):
+        """Render the parts of the frame that never change onto one surface."""
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        bg.fill(COLOR_BG)
 
         # Title
         title = self.font_title.render("Graph Traversal Visualizer", True, COLOR_TEXT)
-        self.screen.blit(title, (50, 25))
+        bg.blit(title, (50, 25))
 
         # Edges
-        for node, neighbors in GRAPH.items():
-            for neighbor in neighbors:
-                self.draw_arrow(
-                    NODE_POSITIONS[node], NODE_POSITIONS[neighbor], (160, 174, 192)
-                )
+        for line_start, line_end, head in self.edge_geom:
+            pygame.draw.line(bg, (160, 174, 192), line_start, line_end, 3)
+            pygame.draw.polygon(bg, (160, 174, 192), head)
+
+        # Panel
+        pygame.draw.rect(bg, COLOR_PANEL, (0, 680, WINDOW_WIDTH, 170))
+        pygame.draw.line(bg, (226, 232, 240), (0, 680), (WINDOW_WIDTH, 680), 2)
+        return bg
+
+    def draw(self):
+        if self._full_redraw:
+            self.screen.blit(self.bg_surf, (0, 0))
+        else:
+            for rect in self.dirty_rects:
+                self.screen.blit(self.bg_surf, rect, rect)
 
         # Nodes
-        for node, pos in NODE_POSITIONS.items():
+        for node, pos in enumerate(POS):
+            idx = self.order_index[node]
             state = "unvisited"
             if node == self.current_node:
                 state = "current"
-            elif node in self.order:
+            elif idx is not None:
                 state = "visited"
-            elif node in self.active_structure:
+            elif node in self.active_set:
                 state = "queued"
 
             pygame.draw.circle(self.screen, NODE_COLORS[state], pos, NODE_RADIUS)
@@ -274,13 +421,11 @@ class GraphVisualizer:
                 self.screen, NODE_COLORS["border_" + state], pos, NODE_RADIUS, 4
             )
 
-            label = self.font_main.render(node, True, COLOR_TEXT)
+            label = self.node_label_surfs[node]
             self.screen.blit(label, label.get_rect(center=pos))
 
-            if node in self.order:
-                idx = self.order.index(node) + 1
-                s_font = pygame.font.SysFont("Arial", 16, bold=True)
-                step_surf = s_font.render(str(idx), True, (255, 255, 255))
+            if idx is not None:
+                step_surf = self.step_num_surfs[idx]
                 pygame.draw.circle(
                     self.screen, COLOR_ACCENT, (pos[0] + 32, pos[1] - 32), 12
                 )
@@ -288,10 +433,6 @@ class GraphVisualizer:
                     step_surf, step_surf.get_rect(center=(pos[0] + 32, pos[1] - 32))
                 )
 
-        # Panel
-        pygame.draw.rect(self.screen, COLOR_PANEL, (0, 680, WINDOW_WIDTH, 170))
-        pygame.draw.line(self.screen, (226, 232, 240), (0, 680), (WINDOW_WIDTH, 680), 2)
-
         # Status
         status_surf = self.font_ui.render(self.status, True, COLOR_TEXT)
         self.screen.blit(status_surf, (50, 695))
@@ -318,7 +459,11 @@ class GraphVisualizer:
         )
         self.screen.blit(speed_label, (750, 785))
 
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self.dirty_rects)
 
     def update(self):
         if self.traversal_gen and not self.animation_finished:
@@ -326,58 +471,110 @@ class GraphVisualizer:
             delay = 1000 / self.speed_slider.value
             if now - self.last_step_time > delay:
                 try:
-                    step_type, node, visited_set, structure = next(self.traversal_gen)
-                    self.active_structure = structure
+                    step_type, node = next(self.traversal_gen)
                     self.last_step_time = now
-
-                    if step_type == "visit":
+                    self._needs_redraw = True
+
+                    # The generators only report what was pushed or popped;
+                    # the displayed queue/stack is rebuilt from those events
+                    if step_type == "init":
+                        self.active_structure = [ID_TO_NAME[node]]
+                        self.active_set = {node}
+                    elif step_type == "visit":
+                        name = ID_TO_NAME[node]
+                        if self.is_bfs:
+                            self.active_structure.pop(0)
+                        else:
+                            # Stale stack entries for visited nodes are popped
+                            # silently by the generator before this one
+                            while self.active_structure.pop() != name:
+                                pass
+                        self.active_set.discard(node)
+                        self.order_index[node] = len(self.order)
+                        self.order.append(name)
                         self.current_node = node
-                        self.status = f"Exploring node {node}..."
+                        self.status = f"Exploring node {name}..."
                     elif step_type in ["queue", "stack"]:
-                        self.status = f"Discovered node {node}."
+                        name = ID_TO_NAME[node]
+                        self.active_structure.append(name)
+                        self.active_set.add(node)
+                        self.status = f"Discovered node {name}."
                     elif step_type == "done":
+                        self.active_structure = []
+                        self.active_set = set()
                         self.status = "Traversal complete."
                         self.current_node = None
                         self.animation_finished = True
                 except StopIteration:
                     self.animation_finished = True
 
+    def handle_click(self, pos):
+        for widget in self.clickables:
+            if widget.rect.collidepoint(pos):
+                break
+        else:
+            for node, (x, y) in enumerate(POS):
+                if math.hypot(pos[0] - x, pos[1] - y) <= NODE_RADIUS:
+                    self.show_path_to(node)
+                    return
+            return
+
+        if isinstance(widget, RadioButton):
+            for b in self.radio_group:
+                b.selected = False
+            widget.selected = True
+            self.start_node = widget.node_id
+            self.reset_state()
+        elif widget.action_id == "bfs":
+            self.reset_state()
+            self.is_bfs = True
+            self.traversal_gen = self.get_bfs_gen(self.start_node)
+        elif widget.action_id == "dfs":
+            self.reset_state()
+            self.is_bfs = False
+            self.traversal_gen = self.get_dfs_gen(self.start_node)
+        elif widget.action_id == "reset":
+            self.reset_state()
+
+    def show_path_to(self, target):
+        """Number the shortest path from the selected start node to target."""
+        start = self.start_node
+        self.reset_state()
+        path = bfs_bidirectional(NAME_TO_ID[start], target)
+        if path is None:
+            self.status = f"No path from {start} to {ID_TO_NAME[target]}."
+            return
+        for i, node in enumerate(path):
+            self.order_index[node] = i
+            self.order.append(ID_TO_NAME[node])
+        self.status = f"Shortest path from {start} to {ID_TO_NAME[target]}."
+
     def run(self):
         running = True
         while running:
-            mx, my = pygame.mouse.get_pos()
+            mouse_pos = pygame.mouse.get_pos()
+            for btn in self.buttons:
+                btn.check_hover(mouse_pos)
+
             for event in pygame.event.get():
+                self._needs_redraw = True
                 if event.type == pygame.QUIT:
                     running = False
-
-                for btn in self.buttons:
-                    btn.check_hover((mx, my))
-                    if event.type == pygame.MOUSEBUTTONDOWN and btn.hovered:
-                        if btn.action_id == "bfs":
-                            self.reset_state()
-                            self.is_bfs = True
-                            self.traversal_gen = self.get_bfs_gen(self.start_node)
-                        elif btn.action_id == "dfs":
-                            self.reset_state()
-                            self.is_bfs = False
-                            self.traversal_gen = self.get_dfs_gen(self.start_node)
-                        elif btn.action_id == "reset":
-                            self.reset_state()
-
-                for rb in self.radio_group:
-                    if event.type == pygame.MOUSEBUTTONDOWN and rb.rect.collidepoint(
-                        (mx, my)
-                    ):
-                        for b in self.radio_group:
-                            b.selected = False
-                        rb.selected = True
-                        self.start_node = rb.node_id
-                        self.reset_state()
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._full_redraw = True
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self.handle_click(event.pos)
 
                 self.speed_slider.handle_event(event)
 
             self.update()
-            self.draw()
+            if self._needs_redraw:
+                self.draw()
+                self._needs_redraw = False
+            elif self.traversal_gen is None or self.animation_finished:
+                # Nothing on screen can change until the next event
+                self.clock.tick(15)
+                continue
             self.clock.tick(FPS)
         pygame.quit()
         sys.exit()
@@ -7,7 +7,6 @@ Run with: uv run python 0901AI231019_File2.py
 
 import pygame
 import sys
-from collections import deque
 
 # Initialize Pygame
 pygame.init()
@@ -45,8 +44,20 @@ MAZE_GRID = [[0, 0, 0], [0, 1, 0], [0, 0, 0]]
 START_POS = (0, 0)
 EXIT_POS = (2, 2)
 
+# Step kinds recorded by bfs_steps / dfs_steps
+STEP_VISIT = 0
+STEP_DISCOVER = 1
+
+# Per-cell display states stored in MazeVisualizer.cell_state
+CELL_UNTOUCHED = 0
+CELL_VISITED = 1
+CELL_PATH = 2
+CELL_CURRENT = 3
+
 
 class UIComponent:
+    __slots__ = ("rect", "hovered")
+
     def __init__(self, rect):
         self.rect = pygame.Rect(rect)
         self.hovered = False
@@ -57,6 +68,16 @@ class UIComponent:
 
 
 class Button(UIComponent):
+    __slots__ = (
+        "text",
+        "color",
+        "hover_color",
+        "action_id",
+        "font",
+        "text_surf",
+        "text_rect",
+    )
+
     def __init__(self, rect, text, color, hover_color, action_id):
         super().__init__(rect)
         self.text = text
@@ -64,16 +85,20 @@ class Button(UIComponent):
         self.hover_color = hover_color
         self.action_id = action_id
         self.font = pygame.font.SysFont("Arial", 22, bold=True)
+        self.text_surf = self.font.render(
+            self.text, True, (255, 255, 255)
+        ).convert_alpha()
+        self.text_rect = self.text_surf.get_rect(center=self.rect.center)
 
     def draw(self, screen):
         draw_color = self.hover_color if self.hovered else self.color
         pygame.draw.rect(screen, draw_color, self.rect, border_radius=10)
-        text_surf = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        screen.blit(self.text_surf, self.text_rect)
 
 
 class Slider(UIComponent):
+    __slots__ = ("min_val", "max_val", "value", "handle_rect", "dragging")
+
     def __init__(self, rect, min_val, max_val, initial_val):
         super().__init__(rect)
         self.min_val = min_val
@@ -126,22 +151,229 @@ def create_maze_graph(grid):
     return graph
 
 
+def create_maze_csr(grid):
+    """Number the open cells of grid and pack their neighbors into CSR lists.
+
+    Returns cells (coordinates by id), node_id (cell -> id), adj_idx (N + 1
+    offsets) and adj (neighbor ids). Neighbors keep the same order as
+    create_maze_graph.
+    """
+    graph = create_maze_graph(grid)
+    cells = list(graph)
+    node_id = {cell: i for i, cell in enumerate(cells)}
+    adj_idx = [0]
+    adj = []
+    for cell in cells:
+        adj.extend(node_id[neighbor] for neighbor in graph[cell])
+        adj_idx.append(len(adj))
+    return cells, node_id, adj_idx, adj
+
+
+def bfs_steps(adj_idx, adj, start_id, exit_id, out_kind, out_node, out_parent):
+    """Run BFS over CSR lists, recording every visit and discover step.
+
+    out_kind/out_node receive the step sequence and out_parent each reached
+    node's predecessor (-1 for the start). Returns the number of steps
+    recorded and whether exit_id was reached.
+    """
+    visited = bytearray(len(adj_idx) - 1)
+    queue = [start_id]
+    head, steps = 0, 0
+    visited[start_id] = 1
+    out_parent[start_id] = -1
+
+    while head < len(queue):
+        u = queue[head]
+        head += 1
+        out_kind[steps] = STEP_VISIT
+        out_node[steps] = u
+        steps += 1
+        if u == exit_id:
+            return steps, True
+
+        for k in range(adj_idx[u], adj_idx[u + 1]):
+            v = adj[k]
+            if not visited[v]:
+                visited[v] = 1
+                out_parent[v] = u
+                queue.append(v)
+                out_kind[steps] = STEP_DISCOVER
+                out_node[steps] = v
+                steps += 1
+    return steps, False
+
+
+def dfs_steps(adj_idx, adj, start_id, exit_id, out_kind, out_node, out_parent):
+    """Run iterative DFS over CSR lists; same outputs as bfs_steps."""
+    visited = bytearray(len(adj_idx) - 1)
+    stack = [start_id]
+    steps = 0
+    out_parent[start_id] = -1
+
+    while stack:
+        u = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        out_kind[steps] = STEP_VISIT
+        out_node[steps] = u
+        steps += 1
+        if u == exit_id:
+            return steps, True
+
+        # Push in reverse so the first neighbor is explored first; the most
+        # recent push is popped first, so overwriting the parent is correct
+        for k in range(adj_idx[u + 1] - 1, adj_idx[u] - 1, -1):
+            v = adj[k]
+            if not visited[v]:
+                out_parent[v] = u
+                stack.append(v)
+                out_kind[steps] = STEP_DISCOVER
+                out_node[steps] = v
+                steps += 1
+    return steps, False
+
+
 class MazeVisualizer:
+    __slots__ = (
+        "screen",
+        "clock",
+        "font_main",
+        "font_title",
+        "font_ui",
+        "_node_id",
+        "_adj_idx",
+        "_adj",
+        "_cells",
+        "_cols",
+        "_out_kind",
+        "_out_node",
+        "_out_parent",
+        "_cell_labels",
+        "_node_labels",
+        "_title_surf",
+        "_caption_surfs",
+        "_legend_surfs",
+        "_text_cache",
+        "_cell_rects",
+        "_node_centers",
+        "_edge_segments",
+        "_background",
+        "_dirty_rects",
+        "_full_redraw",
+        "_needs_redraw",
+        "cell_state",
+        "current_node",
+        "traversal_gen",
+        "last_step_time",
+        "is_bfs",
+        "status",
+        "animation_finished",
+        "comparison_stats",
+        "buttons",
+        "speed_slider",
+        "_button_rects",
+        "_actions",
+    )
+
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = pygame.display.set_mode(
+            (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF
+        )
         pygame.display.set_caption("Maze Challenge: BFS vs DFS")
         self.clock = pygame.time.Clock()
         self.font_main = pygame.font.SysFont("Arial", 28, bold=True)
         self.font_ui = pygame.font.SysFont("Arial", 20)
         self.font_title = pygame.font.SysFont("Arial", 36, bold=True)
 
-        self.graph = create_maze_graph(MAZE_GRID)
+        self._cells, self._node_id, self._adj_idx, self._adj = create_maze_csr(
+            MAZE_GRID
+        )
+        self._cols = len(MAZE_GRID[0])
+        # Step buffers sized for the worst case: every node visited once plus
+        # one discover per directed edge
+        max_steps = len(self._cells) + len(self._adj)
+        self._out_kind = bytearray(max_steps)
+        self._out_node = [0] * max_steps
+        self._out_parent = [0] * len(self._cells)
+
+        # Text that never changes is rendered once; the dynamic lines are
+        # re-rendered only when their string changes
+        wall_label = self.font_ui.render("WALL", True, (255, 255, 255)).convert_alpha()
+        self._cell_labels = {
+            (r, c): wall_label
+            for r, row in enumerate(MAZE_GRID)
+            for c, cell in enumerate(row)
+            if cell == 1
+        }
+        self._cell_labels[START_POS] = self.font_ui.render(
+            "START", True, (255, 255, 255)
+        ).convert_alpha()
+        self._cell_labels[EXIT_POS] = self.font_ui.render(
+            "EXIT", True, (255, 255, 255)
+        ).convert_alpha()
+        self._node_labels = {
+            node: self.font_ui.render(str(node), True, COLOR_TEXT).convert_alpha()
+            for node in self._cells
+        }
+        self._title_surf = self.font_title.render(
+            "The Maze Challenge: Pathfinding Visualizer", True, COLOR_TEXT
+        )
+        self._caption_surfs = [
+            (self.font_main.render("Maze Layout", True, COLOR_TEXT), (150, 130)),
+            (
+                self.font_main.render("Graph Logical Representation", True, COLOR_TEXT),
+                (800, 130),
+            ),
+        ]
+        self._legend_surfs = [
+            (color, self.font_ui.render(label, True, COLOR_TEXT))
+            for label, color in [
+                ("Visited", (198, 246, 213)),
+                ("Current", (255, 175, 125)),
+                ("Path", (237, 137, 54)),
+            ]
+        ]
+        self._text_cache = {}
+
+        # Cell rects, node centers and edge endpoints never move, so they are
+        # computed once; the undirected edges are kept in one direction only
+        self._cell_rects = {
+            (r, c): pygame.Rect(
+                150 + c * CELL_SIZE, 180 + r * CELL_SIZE, CELL_SIZE, CELL_SIZE
+            )
+            for r in range(len(MAZE_GRID))
+            for c in range(self._cols)
+        }
+        self._node_centers = {
+            node: (850 + node[1] * 160, 220 + node[0] * 160) for node in self._cells
+        }
+        centers = [self._node_centers[cell] for cell in self._cells]
+        self._edge_segments = [
+            (centers[u], centers[self._adj[k]])
+            for u in range(len(self._cells))
+            for k in range(self._adj_idx[u], self._adj_idx[u + 1])
+            if u < self._adj[k]
+        ]
+
+        self._background = self.build_background()
+        # Only the maze grid, the graph nodes and the control panel change
+        # between frames; everything else is restored from the background
+        self._dirty_rects = [
+            pygame.Rect(150, 180, self._cols * CELL_SIZE, len(MAZE_GRID) * CELL_SIZE)
+        ]
+        self._dirty_rects.extend(
+            pygame.Rect(x - 36, y - 36, 73, 73) for x, y in self._node_centers.values()
+        )
+        self._dirty_rects.append(pygame.Rect(0, 702, WINDOW_WIDTH, WINDOW_HEIGHT - 702))
+        self._full_redraw = True
+        self._needs_redraw = True
+
         self.reset_state()
         self.setup_ui()
 
     def reset_state(self):
-        self.visited = set()
-        self.path = []
+        self.cell_state = bytearray(len(MAZE_GRID) * self._cols)
         self.current_node = None
         self.traversal_gen = None
         self.last_step_time = 0
@@ -162,175 +394,188 @@ class MazeVisualizer:
         ]
         self.speed_slider = Slider((800, 770, 400, 12), 0.5, 5.0, 1.5)
 
+        self._button_rects = [(btn.rect, btn) for btn in self.buttons]
+        self._actions = {
+            "bfs": self._start_bfs,
+            "dfs": self._start_dfs,
+            "reset": self.reset_state,
+        }
+
+    def _start_bfs(self):
+        self.reset_state()
+        self.is_bfs = True
+        self.traversal_gen = self.get_bfs_gen(START_POS)
+        self._start_clock()
+
+    def _start_dfs(self):
+        self.reset_state()
+        self.is_bfs = False
+        self.traversal_gen = self.get_dfs_gen(START_POS)
+        self._start_clock()
+
+    def _start_clock(self):
+        # Make the first step due immediately; later steps are scheduled
+        # from here rather than from whenever each frame happened to run
+        self.last_step_time = pygame.time.get_ticks() - 1000 / self.speed_slider.value
+
+    def reconstruct_path(self, node):
+        path = []
+        while node != -1:
+            path.append(self._cells[node])
+            node = self._out_parent[node]
+        path.reverse()
+        return path
+
+    def replay_steps(self, algo, start, n_steps, found):
+        """Animate a precomputed traversal one recorded step at a time."""
+        cols = self._cols
+        if algo == "bfs":
+            self.cell_state[start[0] * cols + start[1]] = CELL_VISITED
+            yield ("init", start)
+
+        for k in range(n_steps):
+            u = self._out_node[k]
+            node = self._cells[u]
+            if self._out_kind[k] == STEP_VISIT:
+                if self.current_node is not None:
+                    prev = self.current_node
+                    self.cell_state[prev[0] * cols + prev[1]] = CELL_VISITED
+                self.cell_state[node[0] * cols + node[1]] = CELL_CURRENT
+                self.current_node = node
+                self.comparison_stats[algo] += 1
+                yield ("visit", node)
+            else:
+                # BFS marks cells when queued, DFS only once popped
+                if algo == "bfs":
+                    self.cell_state[node[0] * cols + node[1]] = CELL_VISITED
+                yield ("discover", node)
+
+        if found:
+            for r, c in self.reconstruct_path(u)[:-1]:
+                self.cell_state[r * cols + c] = CELL_PATH
+            yield ("done", node)
+        else:
+            yield ("fail", None)
+
+    def run_steps(self, steps_fn, start):
+        return steps_fn(
+            self._adj_idx,
+            self._adj,
+            self._node_id[start],
+            self._node_id[EXIT_POS],
+            self._out_kind,
+            self._out_node,
+            self._out_parent,
+        )
+
     def get_bfs_gen(self, start):
-        visited = {start}
-        queue = deque([(start, [start])])
-        yield ("init", start, visited, list(queue))
-
-        while queue:
-            node, path = queue.popleft()
-            self.current_node = node
-            self.path = path
-            self.comparison_stats["bfs"] += 1
-            yield ("visit", node, visited, path)
-
-            if node == EXIT_POS:
-                yield ("done", node, visited, path)
-                return
-
-            for neighbor in self.graph[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-                    yield ("discover", neighbor, visited, path)
-        yield ("fail", None, visited, [])
+        n_steps, found = self.run_steps(bfs_steps, start)
+        return self.replay_steps("bfs", start, n_steps, found)
 
     def get_dfs_gen(self, start):
-        visited = set()
-        stack = [(start, [start])]
+        n_steps, found = self.run_steps(dfs_steps, start)
+        return self.replay_steps("dfs", start, n_steps, found)
+
+    def state_colors(self):
+        """Colors for each cell_state code, in code order."""
+        return (
+            CELL_COLORS["open"],
+            CELL_COLORS["visited_bfs"] if self.is_bfs else CELL_COLORS["visited_dfs"],
+            CELL_COLORS["path"],
+            CELL_COLORS["current"],
+        )
 
-        while stack:
-            node, path = stack.pop()
-            if node not in visited:
-                visited.add(node)
-                self.current_node = node
-                self.path = path
-                self.comparison_stats["dfs"] += 1
-                yield ("visit", node, visited, path)
-
-                if node == EXIT_POS:
-                    yield ("done", node, visited, path)
-                    return
-
-                for neighbor in reversed(self.graph[node]):
-                    if neighbor not in visited:
-                        stack.append((neighbor, path + [neighbor]))
-                        yield ("discover", neighbor, visited, path)
-        yield ("fail", None, visited, [])
-
-    def draw_maze_grid(self, start_x, start_y):
-        for r in range(3):
-            for c in range(3):
-                pos = (r, c)
-                color = CELL_COLORS["open"]
-                if MAZE_GRID[r][c] == 1:
-                    color = CELL_COLORS["wall"]
-                elif pos == START_POS:
-                    color = CELL_COLORS["start"]
-                elif pos == EXIT_POS:
-                    color = CELL_COLORS["exit"]
-                elif pos == self.current_node:
-                    color = CELL_COLORS["current"]
-                elif pos in self.path:
-                    color = CELL_COLORS["path"]
-                elif pos in self.visited:
-                    color = (
-                        CELL_COLORS["visited_bfs"]
-                        if self.is_bfs
-                        else CELL_COLORS["visited_dfs"]
-                    )
-
-                rect = pygame.Rect(
-                    start_x + c * CELL_SIZE,
-                    start_y + r * CELL_SIZE,
-                    CELL_SIZE,
-                    CELL_SIZE,
-                )
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (226, 232, 240), rect, 2)
-
-                label = ""
-                if pos == START_POS:
-                    label = "START"
-                elif pos == EXIT_POS:
-                    label = "EXIT"
-                elif MAZE_GRID[r][c] == 1:
-                    label = "WALL"
-
-                if label:
-                    txt = self.font_ui.render(
-                        label,
-                        True,
-                        COLOR_TEXT if color == CELL_COLORS["open"] else (255, 255, 255),
-                    )
-                    self.screen.blit(txt, txt.get_rect(center=rect.center))
-
-    def draw_graph_view(self, start_x, start_y):
-        scale = 160
-        # Edges
-        for node, neighbors in self.graph.items():
-            for neighbor in neighbors:
-                p1 = (start_x + node[1] * scale, start_y + node[0] * scale)
-                p2 = (start_x + neighbor[1] * scale, start_y + neighbor[0] * scale)
-                pygame.draw.line(self.screen, (160, 174, 192), p1, p2, 3)
-
-        # Nodes
-        for node in self.graph.keys():
-            pos = (start_x + node[1] * scale, start_y + node[0] * scale)
-            color = CELL_COLORS["open"]
-            if node == self.current_node:
-                color = CELL_COLORS["current"]
-            elif node in self.path:
-                color = CELL_COLORS["path"]
-            elif node in self.visited:
-                color = (
-                    CELL_COLORS["visited_bfs"]
-                    if self.is_bfs
-                    else CELL_COLORS["visited_dfs"]
-                )
+    def draw_maze_grid(self):
+        state_colors = self.state_colors()
+        for pos, rect in self._cell_rects.items():
+            r, c = pos
+            if MAZE_GRID[r][c] == 1:
+                color = CELL_COLORS["wall"]
+            elif pos == START_POS:
+                color = CELL_COLORS["start"]
+            elif pos == EXIT_POS:
+                color = CELL_COLORS["exit"]
+            else:
+                color = state_colors[self.cell_state[r * self._cols + c]]
+
+            pygame.draw.rect(self.screen, color, rect)
+            pygame.draw.rect(self.screen, (226, 232, 240), rect, 2)
+
+            txt = self._cell_labels.get(pos)
+            if txt:
+                self.screen.blit(txt, txt.get_rect(center=rect.center))
+
+    def draw_graph_edges(self, surface):
+        for p1, p2 in self._edge_segments:
+            pygame.draw.line(surface, (160, 174, 192), p1, p2, 3)
+
+    def draw_graph_view(self):
+        state_colors = self.state_colors()
+        # Nodes (edges live on the background surface)
+        for node, pos in self._node_centers.items():
+            color = state_colors[self.cell_state[node[0] * self._cols + node[1]]]
 
             pygame.draw.circle(self.screen, color, pos, 35)
             pygame.draw.circle(self.screen, (45, 55, 72), pos, 35, 3)
 
-            txt = self.font_ui.render(str(node), True, COLOR_TEXT)
+            txt = self._node_labels[node]
             self.screen.blit(txt, txt.get_rect(center=pos))
 
-    def draw(self):
-        self.screen.fill(COLOR_BG)
+    def render_cached(self, slot, text, color):
+        cached = self._text_cache.get(slot)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font_ui.render(text, True, color).convert_alpha())
+            self._text_cache[slot] = cached
+        return cached[1]
 
-        # Header
-        pygame.draw.rect(self.screen, COLOR_PANEL, (0, 0, WINDOW_WIDTH, 80))
-        title = self.font_title.render(
-            "The Maze Challenge: Pathfinding Visualizer", True, COLOR_TEXT
-        )
-        self.screen.blit(title, (50, 15))
+    def build_background(self):
+        """Render everything that never changes onto one surface."""
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        bg.fill(COLOR_BG)
 
-        # Split View
-        self.draw_maze_grid(150, 180)
-        self.draw_graph_view(850, 220)
+        # Header
+        pygame.draw.rect(bg, COLOR_PANEL, (0, 0, WINDOW_WIDTH, 80))
+        bg.blit(self._title_surf, (50, 15))
 
         # Captions
-        c1 = self.font_main.render("Maze Layout", True, COLOR_TEXT)
-        self.screen.blit(c1, (150, 130))
-        c2 = self.font_main.render("Graph Logical Representation", True, COLOR_TEXT)
-        self.screen.blit(c2, (800, 130))
+        for surf, pos in self._caption_surfs:
+            bg.blit(surf, pos)
 
-        # Bottom Panel
-        pygame.draw.rect(self.screen, COLOR_PANEL, (0, 700, WINDOW_WIDTH, 200))
-        pygame.draw.line(self.screen, (226, 232, 240), (0, 700), (WINDOW_WIDTH, 700), 2)
+        self.draw_graph_edges(bg)
 
-        status_txt = self.font_ui.render(f"Status: {self.status}", True, COLOR_TEXT)
-        self.screen.blit(status_txt, (100, 715))
+        # Bottom Panel
+        pygame.draw.rect(bg, COLOR_PANEL, (0, 700, WINDOW_WIDTH, 200))
+        pygame.draw.line(bg, (226, 232, 240), (0, 700), (WINDOW_WIDTH, 700), 2)
 
         # Legend
         lx = 100
-        for label, color in [
-            ("Visited", (198, 246, 213)),
-            ("Current", (255, 175, 125)),
-            ("Path", (237, 137, 54)),
-        ]:
-            pygame.draw.rect(self.screen, color, (lx, 820, 20, 20))
-            t = self.font_ui.render(label, True, COLOR_TEXT)
-            self.screen.blit(t, (lx + 30, 820))
+        for color, t in self._legend_surfs:
+            pygame.draw.rect(bg, color, (lx, 820, 20, 20))
+            bg.blit(t, (lx + 30, 820))
             lx += 150
+        return bg
+
+    def draw(self):
+        if self._full_redraw:
+            self.screen.blit(self._background, (0, 0))
+        else:
+            for rect in self._dirty_rects:
+                self.screen.blit(self._background, rect, rect)
+
+        # Split View
+        self.draw_maze_grid()
+        self.draw_graph_view()
+
+        status_txt = self.render_cached("status", f"Status: {self.status}", COLOR_TEXT)
+        self.screen.blit(status_txt, (100, 715))
 
         # Stats
         stats_txt = f"Nodes Visited - BFS: {self.comparison_stats['bfs']} | DFS: {self.comparison_stats['dfs']}"
-        st_surf = self.font_ui.render(stats_txt, True, COLOR_ACCENT)
+        st_surf = self.render_cached("stats", stats_txt, COLOR_ACCENT)
         self.screen.blit(st_surf, (800, 715))
 
-        speed_txt = self.font_ui.render(
-            f"Simulation Speed: {self.speed_slider.value:.1f}x", True, COLOR_TEXT
+        speed_txt = self.render_cached(
+            "speed", f"Simulation Speed: {self.speed_slider.value:.1f}x", COLOR_TEXT
         )
         self.screen.blit(speed_txt, (800, 800))
 
@@ -338,54 +583,72 @@ class MazeVisualizer:
             btn.draw(self.screen)
         self.speed_slider.draw(self.screen)
 
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._dirty_rects)
 
     def update(self):
-        if self.traversal_gen and not self.animation_finished:
-            now = pygame.time.get_ticks()
-            delay = 1000 / self.speed_slider.value
-            if now - self.last_step_time > delay:
-                try:
-                    res = next(self.traversal_gen)
-                    type, node, visited, path = res
-                    self.visited = visited
-                    self.last_step_time = now
-
-                    if type == "visit":
-                        self.status = f"Evaluating cell {node}..."
-                    elif type == "done":
-                        self.status = "Exit Found! Path highlighted."
-                        self.animation_finished = True
-                except StopIteration:
-                    self.animation_finished = True
+        now = pygame.time.get_ticks()
+        delay = 1000 / self.speed_slider.value
+        # Run every step that is due, not just one per frame, so the
+        # animation keeps pace when the step delay is shorter than a frame
+        while (
+            self.traversal_gen
+            and not self.animation_finished
+            and now - self.last_step_time >= delay
+        ):
+            res = next(self.traversal_gen, None)
+            if res is None:
+                self.animation_finished = True
+                break
+            type, node = res
+            self.last_step_time += delay
+            self._needs_redraw = True
+
+            if type == "visit":
+                self.status = f"Evaluating cell {node}..."
+            elif type == "done":
+                self.status = "Exit Found! Path highlighted."
+                self.animation_finished = True
 
     def run(self):
         running = True
         while running:
-            mx, my = pygame.mouse.get_pos()
-            for event in pygame.event.get():
+            animating = self.traversal_gen is not None and not self.animation_finished
+            if animating:
+                events = pygame.event.get()
+            else:
+                # Nothing moves on screen while idle, so block until input
+                # arrives instead of redrawing at full frame rate
+                event = pygame.event.wait(timeout=100)
+                events = [] if event.type == pygame.NOEVENT else [event]
+                events.extend(pygame.event.get())
+
+            for event in events:
+                self._needs_redraw = True
                 if event.type == pygame.QUIT:
                     running = False
-
-                for btn in self.buttons:
-                    btn.check_hover((mx, my))
-                    if event.type == pygame.MOUSEBUTTONDOWN and btn.hovered:
-                        if btn.action_id == "bfs":
-                            self.reset_state()
-                            self.is_bfs = True
-                            self.traversal_gen = self.get_bfs_gen(START_POS)
-                        elif btn.action_id == "dfs":
-                            self.reset_state()
-                            self.is_bfs = False
-                            self.traversal_gen = self.get_dfs_gen(START_POS)
-                        elif btn.action_id == "reset":
-                            self.reset_state()
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._full_redraw = True
+                elif event.type == pygame.MOUSEMOTION:
+                    for btn in self.buttons:
+                        btn.check_hover(event.pos)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    for rect, btn in self._button_rects:
+                        if rect.collidepoint(event.pos):
+                            self._actions[btn.action_id]()
+                            break
 
                 self.speed_slider.handle_event(event)
 
             self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            if self._needs_redraw:
+                self.draw()
+                self._needs_redraw = False
+            if animating:
+                self.clock.tick(FPS)
         pygame.quit()
         sys.exit()
 